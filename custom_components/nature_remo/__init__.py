@@ -149,27 +149,20 @@ class NatureRemoAPI:
 class NatureRemoBase(CoordinatorEntity):
     """Nature Remo entity base class."""
 
+    _attr_should_poll = False
+
     def __init__(self, coordinator: DataUpdateCoordinator, appliance: Dict[str, Any]) -> None:
         super().__init__(coordinator)
-        self._name = f"Nature Remo {appliance['nickname']}"
+        self._name = f"Nature Remo {appliance['nickname']}".strip()
         self._appliance_id = appliance["id"]
         self._device = appliance["device"]
+        self._attr_unique_id = self._appliance_id
 
     @cached_property
     def name(self) -> str | None:
         """Return the name of the sensor."""
         return self._name
 
-    @cached_property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return self._appliance_id
-
-    @cached_property
-    def should_poll(self) -> bool:
-        """Return the polling requirement of the entity."""
-        return False
-
     @cached_property
     def device_info(self) -> DeviceInfo | None:
         """Return the device info for the sensor."""
@@ -185,26 +178,19 @@ class NatureRemoBase(CoordinatorEntity):
 class NatureRemoDeviceBase(CoordinatorEntity):
     """Nature Remo Device entity base class."""
 
+    _attr_should_poll = False
+
     def __init__(self, coordinator: DataUpdateCoordinator, device: Dict[str, Any]) -> None:
         super().__init__(coordinator)
-        self._name = f"Nature Remo {device['name']}"
+        self._name = f"Nature Remo {device['name']}".strip()
         self._device = device
+        self._attr_unique_id = device["id"]
 
     @cached_property
     def name(self) -> str | None:
         """Return the name of the sensor."""
         return self._name
 
-    @cached_property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return self._device["id"]
-
-    @cached_property
-    def should_poll(self) -> bool:
-        """Return the polling requirement of the entity."""
-        return False
-
     @cached_property
     def device_info(self) -> DeviceInfo | None:
         """Return the device info for the sensor."""
@@ -9,16 +9,23 @@ EPC_CUMULATIVE_ENERGY_UNIT = 225
 EPC_CUMULATIVE_RETURNED_ENERGY = 227
 EPC_MEASURED_INSTANTANEOUS_POWER = 231
 
-CUMULATIVE_ENERGY_UNIT_TABLE: dict[int, float] = {
-    0: 1,
-    1: 0.1,
-    2: 0.01,
-    3: 0.001,
-    4: 0.0001,
-    10: 10,
-    11: 100,
-    12: 1000,
-}
+# Multipliers indexed by the cumulative energy unit code (EPC 0xE1). Codes 5-9
+# are reserved by the ECHONET Lite spec and fall back to 1.
+CUMULATIVE_ENERGY_UNIT_TABLE: tuple[float, ...] = (
+    1,
+    0.1,
+    0.01,
+    0.001,
+    0.0001,
+    1,
+    1,
+    1,
+    1,
+    1,
+    10,
+    100,
+    1000,
+)
 
 
 def parse_echonet_properties(properties: Iterable[Mapping[str, Any]]) -> dict[int, float]:
@@ -39,5 +46,9 @@ def calculate_cumulative_energy(properties: Mapping[int, float], epc: int) -> fl
     value = properties[epc]
     coefficient = properties.get(EPC_COEFFICIENT, 1)
     unit_code = int(properties.get(EPC_CUMULATIVE_ENERGY_UNIT, 0))
-    unit = CUMULATIVE_ENERGY_UNIT_TABLE.get(unit_code, 1)
+    unit = (
+        CUMULATIVE_ENERGY_UNIT_TABLE[unit_code]
+        if 0 <= unit_code < len(CUMULATIVE_ENERGY_UNIT_TABLE)
+        else 1
+    )
     return value * coefficient * unit
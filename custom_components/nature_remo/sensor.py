@@ -1,16 +1,16 @@
 """Support for Nature Remo E energy sensor."""
 
 import logging
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, Dict
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.components.sensor.const import SensorDeviceClass, SensorStateClass
 from homeassistant.const import LIGHT_LUX, PERCENTAGE, UnitOfEnergy, UnitOfPower, UnitOfTemperature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from propcache.api import cached_property
 
 from . import DOMAIN, NatureRemoBase, NatureRemoDeviceBase
 from .echonet import (
@@ -24,6 +24,43 @@ from .echonet import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Parsed smart meter properties keyed by appliance ID, alongside the raw list they
+# were parsed from. The coordinator replaces the payload on every refresh, so an
+# identity check on the raw list is enough to detect stale entries.
+_PROPERTIES_CACHE: dict[str, tuple[list[Dict[str, Any]], dict[int, float]]] = {}
+
+
+@dataclass(frozen=True, kw_only=True)
+class NatureRemoSensorEntityDescription(SensorEntityDescription):
+    """Describes a Nature Remo device sensor."""
+
+    event_key: str
+
+
+DEVICE_SENSOR_DESCRIPTIONS: tuple[NatureRemoSensorEntityDescription, ...] = (
+    NatureRemoSensorEntityDescription(
+        key="temperature",
+        event_key="te",
+        name="Temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    NatureRemoSensorEntityDescription(
+        key="humidity",
+        event_key="hu",
+        name="Humidity",
+        device_class=SensorDeviceClass.HUMIDITY,
+        native_unit_of_measurement=PERCENTAGE,
+    ),
+    NatureRemoSensorEntityDescription(
+        key="illuminance",
+        event_key="il",
+        name="Illuminance",
+        device_class=SensorDeviceClass.ILLUMINANCE,
+        native_unit_of_measurement=LIGHT_LUX,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -46,159 +83,137 @@ async def async_setup_entry(
                 entities.append(NatureRemoEnergySensor(coordinator, appliance))
             if has_epc(properties, EPC_CUMULATIVE_RETURNED_ENERGY):
                 entities.append(NatureRemoReturnedEnergySensor(coordinator, appliance))
+    appliance_device_ids = {appliance["device"]["id"] for appliance in appliances.values()}
     for device in devices.values():
         # skip devices that include in appliances
-        if device["id"] in [appliance["device"]["id"] for appliance in appliances.values()]:
+        if device["id"] in appliance_device_ids:
             continue
-        for sensor in device["newest_events"].keys():
-            if sensor == "te":
-                entities.append(NatureRemoTemperatureSensor(coordinator, device))
-            elif sensor == "hu":
-                entities.append(NatureRemoHumiditySensor(coordinator, device))
-            elif sensor == "il":
-                entities.append(NatureRemoIlluminanceSensor(coordinator, device))
+        entities.extend(
+            NatureRemoDeviceSensor(coordinator, device, description)
+            for description in DEVICE_SENSOR_DESCRIPTIONS
+            if description.event_key in device["newest_events"]
+        )
 
     async_add_entities(entities)
 
 
 def _smart_meter_properties(appliance: Dict[str, Any]) -> dict[int, float]:
     """Return parsed ECHONET Lite properties for a smart meter appliance."""
-    return parse_echonet_properties(appliance["smart_meter"]["echonetlite_properties"])
+    properties = appliance["smart_meter"]["echonetlite_properties"]
+    cached = _PROPERTIES_CACHE.get(appliance["id"])
+    if cached is not None and cached[0] is properties:
+        return cached[1]
+
+    parsed = parse_echonet_properties(properties)
+    _PROPERTIES_CACHE[appliance["id"]] = (properties, parsed)
+    return parsed
 
 
 class NatureRemoE(NatureRemoBase, SensorEntity):
     """Implementation of a Nature Remo E sensor."""
 
+    entity_description = SensorEntityDescription(
+        key="power",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.WATT,
+    )
+
     def __init__(self, coordinator: DataUpdateCoordinator, appliance: Dict[str, Any]) -> None:
         super().__init__(coordinator, appliance)
-        self._name = self._name.strip() + " Power"
-        self.entity_description = SensorEntityDescription(
-            key="power",
-            name=self._name,
-            device_class=SensorDeviceClass.POWER,
-            native_unit_of_measurement=UnitOfPower.WATT,
-        )
+        self._name = f"{self._name} Power"
+        self._update()
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update()
+        self.async_write_ha_state()
+
+    def _update(self) -> None:
         appliance = self.coordinator.data["appliances"][self._appliance_id]
-        measured_instantaneous = _smart_meter_properties(appliance).get(
+        self._attr_native_value = _smart_meter_properties(appliance).get(
             EPC_MEASURED_INSTANTANEOUS_POWER
         )
-        _LOGGER.debug("Current state: %sW", measured_instantaneous)
-        return measured_instantaneous
+        _LOGGER.debug("Current state: %sW", self._attr_native_value)
 
 
 class NatureRemoCumulativeEnergySensorBase(NatureRemoBase, SensorEntity):
     """Cumulative energy sensor base for Nature Remo E."""
 
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _epc: int
     _sensor_type: str
 
     def __init__(self, coordinator: DataUpdateCoordinator, appliance: Dict[str, Any]) -> None:
         super().__init__(coordinator, appliance)
-        self._name = self._name.strip() + f" Energy ({self._sensor_type})"
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        self._name = f"{self._name} Energy ({self._sensor_type})"
+        self._attr_unique_id = f"{self._appliance_id}-cumulative-energy-{self._sensor_type.lower()}"
+        self._available: bool = False
+        self._update()
 
     @property
-    def native_value(self) -> float | None:
+    def available(self) -> bool:
+        """Return whether the smart meter reports this cumulative energy EPC."""
+        return self._available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update()
+        self.async_write_ha_state()
+
+    def _update(self) -> None:
         appliance = self.coordinator.data["appliances"][self._appliance_id]
         try:
-            return calculate_cumulative_energy(_smart_meter_properties(appliance), self._epc)
+            properties = _smart_meter_properties(appliance)
+            self._available = has_epc(properties, self._epc)
+            self._attr_native_value = calculate_cumulative_energy(properties, self._epc)
         except (KeyError, TypeError, ValueError) as err:
             _LOGGER.warning("Energy calculation error for EPC %s: %s", self._epc, err)
-            return None
-
-    @property
-    def available(self) -> bool:
-        appliance = self.coordinator.data["appliances"][self._appliance_id]
-        try:
-            return has_epc(_smart_meter_properties(appliance), self._epc)
-        except KeyError, TypeError, ValueError:
-            return False
-
-    @cached_property
-    def unique_id(self) -> str | None:
-        return f"{self._appliance_id}-cumulative-energy-{self._sensor_type.lower()}"
+            self._available = False
+            self._attr_native_value = None
 
 
 class NatureRemoEnergySensor(NatureRemoCumulativeEnergySensorBase):
-    _epc = 224
-    _sensor_type = "Consumed"
+    """Cumulative consumed energy sensor for Nature Remo E."""
 
-    def __init__(self, coordinator: DataUpdateCoordinator, appliance: Dict[str, Any]) -> None:
-        super().__init__(coordinator, appliance)
+    _epc = EPC_CUMULATIVE_CONSUMED_ENERGY
+    _sensor_type = "Consumed"
 
 
 class NatureRemoReturnedEnergySensor(NatureRemoCumulativeEnergySensorBase):
-    _epc = 227
-    _sensor_type = "Returned"
+    """Cumulative returned energy sensor for Nature Remo E."""
 
-    def __init__(self, coordinator: DataUpdateCoordinator, appliance: Dict[str, Any]) -> None:
-        super().__init__(coordinator, appliance)
+    _epc = EPC_CUMULATIVE_RETURNED_ENERGY
+    _sensor_type = "Returned"
 
 
-class NatureRemoTemperatureSensor(NatureRemoDeviceBase, SensorEntity):
+class NatureRemoDeviceSensor(NatureRemoDeviceBase, SensorEntity):
     """Implementation of a Nature Remo sensor."""
 
-    def __init__(self, coordinator: DataUpdateCoordinator, device: Dict[str, Any]) -> None:
-        super().__init__(coordinator, device)
-        self._name = self._name.strip() + " Temperature"
-        self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-        self._attr_device_class = SensorDeviceClass.TEMPERATURE
-
-    @cached_property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return self._device["id"] + "-temperature"
-
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        device = self.coordinator.data["devices"][self._device["id"]]
-        return device["newest_events"]["te"]["val"]
-
+    entity_description: NatureRemoSensorEntityDescription
 
-class NatureRemoHumiditySensor(NatureRemoDeviceBase, SensorEntity):
-    """Implementation of a Nature Remo sensor."""
-
-    def __init__(self, coordinator: DataUpdateCoordinator, device: Dict[str, Any]) -> None:
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        device: Dict[str, Any],
+        description: NatureRemoSensorEntityDescription,
+    ) -> None:
         super().__init__(coordinator, device)
-        self._name = self._name.strip() + " Humidity"
-        self._attr_native_unit_of_measurement = PERCENTAGE
-        self._attr_device_class = SensorDeviceClass.HUMIDITY
-
-    @cached_property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return self._device["id"] + "-humidity"
-
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        device = self.coordinator.data["devices"][self._device["id"]]
-        return device["newest_events"]["hu"]["val"]
-
-
-class NatureRemoIlluminanceSensor(NatureRemoDeviceBase, SensorEntity):
-    """Implementation of a Nature Remo sensor."""
-
-    def __init__(self, coordinator: DataUpdateCoordinator, device: Dict[str, Any]) -> None:
-        super().__init__(coordinator, device)
-        self._name = self._name.strip() + " Illuminance"
-        self._attr_native_unit_of_measurement = LIGHT_LUX
-        self._attr_device_class = SensorDeviceClass.ILLUMINANCE
-
-    @cached_property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return self._device["id"] + "-illuminance"
-
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the state of the sensor."""
+        self.entity_description = description
+        self._name = f"{self._name} {description.name}"
+        self._attr_unique_id = f"{self._device['id']}-{description.key}"
+        self._update()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update()
+        self.async_write_ha_state()
+
+    def _update(self) -> None:
         device = self.coordinator.data["devices"][self._device["id"]]
-        return device["newest_events"]["il"]["val"]
+        event = device["newest_events"][self.entity_description.event_key]
+        self._attr_native_value = event["val"]
@@ -45,6 +45,22 @@ def test_calculate_cumulative_energy_defaults_missing_coefficient_and_unit() ->
     )
 
 
+def test_calculate_cumulative_energy_ignores_unknown_unit_codes() -> None:
+    for unit_code in (5, 13, -1):
+        properties = {
+            echonet.EPC_CUMULATIVE_CONSUMED_ENERGY: 42,
+            echonet.EPC_CUMULATIVE_ENERGY_UNIT: unit_code,
+        }
+
+        assert (
+            echonet.calculate_cumulative_energy(
+                properties,
+                echonet.EPC_CUMULATIVE_CONSUMED_ENERGY,
+            )
+            == 42
+        )
+
+
 def test_calculate_cumulative_energy_returns_none_for_missing_epc() -> None:
     assert echonet.calculate_cumulative_energy({}, echonet.EPC_CUMULATIVE_RETURNED_ENERGY) is None
 
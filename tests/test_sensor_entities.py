@@ -3,12 +3,14 @@
 from typing import Any
 
 from custom_components.nature_remo.sensor import (
+    DEVICE_SENSOR_DESCRIPTIONS,
+    NatureRemoDeviceSensor,
     NatureRemoEnergySensor,
-    NatureRemoHumiditySensor,
-    NatureRemoIlluminanceSensor,
-    NatureRemoTemperatureSensor,
+    _smart_meter_properties,
 )
 
+TEMPERATURE, HUMIDITY, ILLUMINANCE = DEVICE_SENSOR_DESCRIPTIONS
+
 
 class FakeCoordinator:
     """Minimal coordinator test double."""
@@ -25,9 +27,18 @@ def test_device_sensor_unique_ids_are_sensor_specific() -> None:
     }
     coordinator = FakeCoordinator({"devices": {"device-1": device}})
 
-    assert NatureRemoTemperatureSensor(coordinator, device).unique_id == "device-1-temperature"  # type: ignore[arg-type]
-    assert NatureRemoHumiditySensor(coordinator, device).unique_id == "device-1-humidity"  # type: ignore[arg-type]
-    assert NatureRemoIlluminanceSensor(coordinator, device).unique_id == "device-1-illuminance"  # type: ignore[arg-type]
+    assert (
+        NatureRemoDeviceSensor(coordinator, device, TEMPERATURE).unique_id  # type: ignore[arg-type]
+        == "device-1-temperature"
+    )
+    assert (
+        NatureRemoDeviceSensor(coordinator, device, HUMIDITY).unique_id  # type: ignore[arg-type]
+        == "device-1-humidity"
+    )
+    assert (
+        NatureRemoDeviceSensor(coordinator, device, ILLUMINANCE).unique_id  # type: ignore[arg-type]
+        == "device-1-illuminance"
+    )
 
 
 def test_device_sensor_native_values_follow_coordinator_data() -> None:
@@ -37,11 +48,12 @@ def test_device_sensor_native_values_follow_coordinator_data() -> None:
         "newest_events": {"te": {"val": 21.5}},
     }
     coordinator = FakeCoordinator({"devices": {"device-1": device}})
-    sensor = NatureRemoTemperatureSensor(coordinator, device)  # type: ignore[arg-type]
+    sensor = NatureRemoDeviceSensor(coordinator, device, TEMPERATURE)  # type: ignore[arg-type]
 
     assert sensor.native_value == 21.5
 
     coordinator.data["devices"]["device-1"]["newest_events"]["te"]["val"] = 22.5
+    sensor._update()  # noqa: SLF001
 
     assert sensor.native_value == 22.5
 
@@ -73,8 +85,27 @@ def test_cumulative_energy_sensor_calculates_from_coordinator_data() -> None:
     assert sensor.available
     assert sensor.native_value == 20
 
-    coordinator.data["appliances"]["appliance-1"]["smart_meter"]["echonetlite_properties"][0][
-        "val"
-    ] = 110
+    coordinator.data["appliances"]["appliance-1"]["smart_meter"]["echonetlite_properties"] = [
+        {"epc": 224, "val": 110},
+        {"epc": 211, "val": 2},
+        {"epc": 225, "val": 1},
+    ]
+    sensor._update()  # noqa: SLF001
 
     assert sensor.native_value == 22
+
+
+def test_smart_meter_properties_are_parsed_once_per_payload() -> None:
+    appliance = {
+        "id": "appliance-1",
+        "smart_meter": {"echonetlite_properties": [{"epc": 231, "val": 500}]},
+    }
+
+    parsed = _smart_meter_properties(appliance)
+
+    assert parsed == {231: 500}
+    assert _smart_meter_properties(appliance) is parsed
+
+    appliance["smart_meter"] = {"echonetlite_properties": [{"epc": 231, "val": 600}]}
+
+    assert _smart_meter_properties(appliance) == {231: 600}